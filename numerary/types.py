@@ -8,7 +8,6 @@
 
 import logging
 import math
-import sys
 import traceback
 from abc import abstractmethod, abstractproperty
 from decimal import Decimal
@@ -433,11 +432,6 @@ class SupportsFloorCeil(
 
     !!! note
 
-        This is of limited value for Python versions prior to 3.9, since ``#!python
-        float.__floor__`` and ``#!python float.__ceil__`` were not defined. If support
-        for those environments is important, consider using
-        [``SupportsFloat``][numerary.types.SupportsFloat] instead.
-
         See also the [``__floor__``][numerary.types.__floor__] and
         [``__ceil__``][numerary.types.__ceil__] helper functions.
 
@@ -473,12 +467,6 @@ class SupportsFloorCeil(
     """
 
 
-# Prior to Python 3.9, floats didn't have an explicit __floor__ method; it was
-# "directly" supported in math.floor, so the pure protocol approach thinks they're not
-# supported
-if sys.version_info < (3, 9):
-    SupportsFloorCeil.includes(float)
-
 _assert_isinstance(int, float, bool, Decimal, Fraction, target_t=SupportsFloorCeil)
 
 
@@ -157,10 +157,11 @@ def test_integral_like_numpy() -> None:
 
         # I have no idea why numpy.uint64 is special in this regard
         if isinstance(good_val, numpy.uint64):
-            assert good_val >> type(good_val)(0) == good_val, f"{good_val!r}"
-            assert good_val << type(good_val)(0) == good_val, f"{good_val!r}"
-            assert good_val & type(good_val)(0) == type(good_val)(0), f"{good_val!r}"
-            assert good_val | type(good_val)(0) == good_val, f"{good_val!r}"
+            zero = type(good_val)(0)
+            assert good_val >> zero == good_val, f"{good_val!r}"
+            assert good_val << zero == good_val, f"{good_val!r}"
+            assert good_val & zero == zero, f"{good_val!r}"
+            assert good_val | zero == good_val, f"{good_val!r}"
         else:
             assert good_val >> 0 == good_val, f"{good_val!r}"
             assert good_val << 0 == good_val, f"{good_val!r}"
@@ -133,9 +133,9 @@ def test_supports_conjugate_numpy() -> None:
     float32_val: SupportsConjugate = numpy.float32(-273.15)
     float64_val: SupportsConjugate = numpy.float64(-273.15)
     float128_val: SupportsConjugate = numpy.float128(-273.15)
-    csingle_val: SupportsConjugate = numpy.float32(-273.15)
-    cdouble_val: SupportsConjugate = numpy.float64(-273.15)
-    clongdouble_val: SupportsConjugate = numpy.float128(-273.15)
+    csingle_val: SupportsConjugate = numpy.csingle(-273.15)
+    cdouble_val: SupportsConjugate = numpy.cdouble(-273.15)
+    clongdouble_val: SupportsConjugate = numpy.clongdouble(-273.15)
 
     for good_val in (
         uint8_val,
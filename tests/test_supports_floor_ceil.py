@@ -6,7 +6,6 @@
 # software in any capacity.
 # ======================================================================================
 
-import sys
 from decimal import Decimal
 from fractions import Fraction
 from typing import cast
@@ -82,15 +81,13 @@ def test_floor_ceil() -> None:
         assert not isinstance(bad_val, SupportsFloorCeil), f"{bad_val!r}"
 
 
-@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires Python >=3.9")
 def test_floor_ceil_float() -> None:
-    if sys.version_info >= (3, 9):
-        float_val: SupportsFloorCeil = -273.15
+    float_val: SupportsFloorCeil = -273.15
 
-        for good_val in (float_val,):
-            assert isinstance(good_val, SupportsFloorCeil), f"{good_val!r}"
-            assert __floor__(good_val), f"{good_val!r}"
-            assert __ceil__(good_val), f"{good_val!r}"
+    for good_val in (float_val,):
+        assert isinstance(good_val, SupportsFloorCeil), f"{good_val!r}"
+        assert __floor__(good_val), f"{good_val!r}"
+        assert __ceil__(good_val), f"{good_val!r}"
 
 
 def test_floor_ceil_beartype() -> None:
@@ -8,7 +8,7 @@
 
 from decimal import Decimal
 from fractions import Fraction
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from beartype import beartype, roar
@@ -49,6 +49,8 @@ class SageLikeRational:
     issue](https://trac.sagemath.org/ticket/28234) for more details.
     """
 
+    __slots__: Any = ("_numerator", "_denominator")
+
     def __init__(self, numerator: int, denominator: int = 1):
         self._numerator = numerator
         self._denominator = denominator
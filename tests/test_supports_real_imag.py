@@ -144,9 +144,9 @@ def test_supports_real_imag_numpy() -> None:
     float32_val: SupportsRealImag = numpy.float32(-273.15)
     float64_val: SupportsRealImag = numpy.float64(-273.15)
     float128_val: SupportsRealImag = numpy.float128(-273.15)
-    csingle_val: SupportsRealImag = numpy.float32(-273.15)
-    cdouble_val: SupportsRealImag = numpy.float64(-273.15)
-    clongdouble_val: SupportsRealImag = numpy.float128(-273.15)
+    csingle_val: SupportsRealImag = numpy.csingle(-273.15)
+    cdouble_val: SupportsRealImag = numpy.cdouble(-273.15)
+    clongdouble_val: SupportsRealImag = numpy.clongdouble(-273.15)
 
     for good_val in (
         uint8_val,
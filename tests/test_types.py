@@ -7,14 +7,29 @@
 # ======================================================================================
 
 from abc import abstractmethod
-from typing import Tuple
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Tuple
 
 import pytest
 from beartype import beartype
 from beartype.roar import BeartypeException
 
 from numerary import IntegralLike, RealLike
-from numerary.types import CachingProtocolMeta, Protocol, runtime_checkable
+from numerary.types import (
+    CachingProtocolMeta,
+    Protocol,
+    SupportsConjugate,
+    SupportsDivmod,
+    SupportsFloorCeil,
+    SupportsIntegralOps,
+    SupportsIntegralPow,
+    SupportsNumeratorDenominator,
+    SupportsRealImag,
+    SupportsRealOps,
+    SupportsTrunc,
+    runtime_checkable,
+)
 
 __all__ = ()
 
@@ -111,18 +126,48 @@ def test_beartype_validators() -> None:
 def test_caching_protocol_meta_cache_overrides() -> None:
     one: SupportsOne = One()
     assert isinstance(one, SupportsOne)
+    assert SupportsOne._abc_inst_check_cache[One] is True
 
     SupportsOne.excludes(One)
     assert not isinstance(one, SupportsOne)
+    assert SupportsOne._abc_inst_check_cache[One] is False
 
     SupportsOne.reset_for(One)
+    assert One not in SupportsOne._abc_inst_check_cache
     assert isinstance(one, SupportsOne)
+    assert SupportsOne._abc_inst_check_cache[One] is True
 
     two = Two()
     assert not isinstance(two, SupportsOne)
+    assert SupportsOne._abc_inst_check_cache[Two] is False
 
     SupportsOne.includes(Two)
     assert isinstance(two, SupportsOne)
+    assert SupportsOne._abc_inst_check_cache[Two] is True
 
     SupportsOne.reset_for(Two)
+    assert Two not in SupportsOne._abc_inst_check_cache
     assert not isinstance(two, SupportsOne)
+
+
+def test_caching_protocol_meta_caches_by_type() -> None:
+    protocol_t: CachingProtocolMeta
+    good_val: Any
+    bad_val: Any
+
+    for protocol_t, good_val, bad_val in (
+        (SupportsConjugate, Fraction(-27315, 100), "-273.15"),
+        (SupportsDivmod, Decimal("-273.15"), complex(-273.15)),
+        (SupportsFloorCeil, Fraction(-27315, 100), complex(-273.15)),
+        (SupportsIntegralOps, -273, Fraction(-27315, 100)),
+        (SupportsIntegralPow, True, "-273"),
+        (SupportsNumeratorDenominator, Fraction(-27315, 100), -273.15),
+        (SupportsRealImag, complex(-273.15), "-273.15"),
+        (SupportsRealOps, Decimal("-273.15"), complex(-273.15)),
+        (SupportsTrunc, -273.15, complex(-273.15)),
+    ):
+        for val, expected in ((good_val, True), (bad_val, False)):
+            assert isinstance(val, protocol_t) is expected, f"{val!r}"
+            # Subsequent checks of the same type should be served from the cache
+            assert type(val) in protocol_t._abc_inst_check_cache, f"{val!r}"
+            assert protocol_t._abc_inst_check_cache[type(val)] is expected, f"{val!r}"